@@ -1,20 +1,37 @@
 # main.py
+import logging
 import os
 from src import create_app
 from flask import request
 
 app = create_app()
 
+# Cap on how much of a request body is echoed into DEBUG logs
+_LOG_BODY_BYTES = 512
+# Liveness probes and Swagger assets are too chatty to be worth logging
+_QUIET_PATHS = frozenset({"/health", "/apispec_1.json"})
+_QUIET_PREFIX = "/flasgger_static"
+
+def _is_quiet(path: str) -> bool:
+    return path in _QUIET_PATHS or path.startswith(_QUIET_PREFIX)
+
 @app.before_request
 def log_request_info():
-    app.logger.info(f"➡️ {request.method} {request.path} params={request.args} body={request.get_data(as_text=True)}")
+    if _is_quiet(request.path):
+        return
+    # Lazy %-args: nothing is formatted unless the record is actually emitted
+    app.logger.info("➡️ %s %s params=%s", request.method, request.path, request.args)
+    if app.logger.isEnabledFor(logging.DEBUG):
+        app.logger.debug("body=%r", request.get_data(cache=True)[:_LOG_BODY_BYTES])
 
 @app.after_request
 def log_response_info(response):
-    app.logger.info(f"⬅️ {request.method} {request.path} status={response.status}")
+    if _is_quiet(request.path):
+        return response
+    app.logger.info("⬅️ %s %s status=%s", request.method, request.path, response.status)
     return response
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", "5050"))  # use 5050 by default
     debug = os.getenv("FLASK_DEBUG", "1") == "1"
-    app.run(host="0.0.0.0", port=port, debug=debug)
\ No newline at end of file
+    app.run(host="0.0.0.0", port=port, debug=debug)
@@ -17,7 +17,9 @@ CREATE TABLE IF NOT EXISTS fuel_price_history (
   valid_from       TIMESTAMPTZ NOT NULL DEFAULT NOW(),
   valid_to         TIMESTAMPTZ
 );
-CREATE INDEX IF NOT EXISTS idx_price_hist_fuel_type_id ON fuel_price_history(fuel_type_id);
+-- (fuel_type_id, valid_from) serves the FK lookups and price_history's ORDER BY valid_from
+CREATE INDEX IF NOT EXISTS idx_fph_ft_valid ON fuel_price_history(fuel_type_id, valid_from);
+DROP INDEX IF EXISTS idx_price_hist_fuel_type_id;
 
 -- Sales (immutable facts)
 CREATE TABLE IF NOT EXISTS sales (
@@ -28,5 +30,73 @@ CREATE TABLE IF NOT EXISTS sales (
   amount           NUMERIC(14,2) NOT NULL CHECK (amount >= 0),
   sold_at          TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
+-- The btree serves ORDER BY sold_at (GET /sales streams newest first via an
+-- index scan, so the cursor's first batch needs no full sort)
 CREATE INDEX IF NOT EXISTS idx_sales_sold_at ON sales(sold_at);
-CREATE INDEX IF NOT EXISTS idx_sales_fuel_type_id ON sales(fuel_type_id);
+-- sold_at only grows (append-only facts), so a BRIN index also answers wide
+-- date-range aggregates cheaply; BRIN cannot return rows in order
+CREATE INDEX IF NOT EXISTS idx_sales_sold_at_brin ON sales USING BRIN (sold_at);
+-- Per-fuel-type filters with time ranges/ordering; also covers FK lookups on fuel_type_id
+CREATE INDEX IF NOT EXISTS idx_sales_ft_sold_at ON sales(fuel_type_id, sold_at);
+DROP INDEX IF EXISTS idx_sales_fuel_type_id;
+
+-- Daily sales rollup per fuel type, kept current by a statement-level trigger
+-- on sales inserts (sales are never updated or deleted). Reports read from it
+-- when their date range covers whole days, so they aggregate O(days), not O(sales).
+CREATE TABLE IF NOT EXISTS sales_daily (
+  fuel_type_id     BIGINT NOT NULL REFERENCES fuel_types(id) ON DELETE CASCADE,
+  d                TIMESTAMPTZ NOT NULL,              -- date_trunc('day', sold_at)
+  revenue          NUMERIC(18,2) NOT NULL DEFAULT 0,  -- SUM(amount)
+  litres           NUMERIC(18,3) NOT NULL DEFAULT 0,  -- SUM(litres)
+  tx_count         BIGINT NOT NULL DEFAULT 0,
+  wsum_price       NUMERIC NOT NULL DEFAULT 0,        -- SUM(price_at_sale * litres)
+  sum_price        NUMERIC NOT NULL DEFAULT 0,        -- SUM(price_at_sale), for plain AVG
+  first_sale_at    TIMESTAMPTZ,
+  last_sale_at     TIMESTAMPTZ,
+  PRIMARY KEY (fuel_type_id, d)
+);
+CREATE INDEX IF NOT EXISTS idx_sales_daily_d ON sales_daily(d);
+
+CREATE OR REPLACE FUNCTION sales_daily_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  INSERT INTO sales_daily AS sd
+         (fuel_type_id, d, revenue, litres, tx_count, wsum_price, sum_price, first_sale_at, last_sale_at)
+  SELECT fuel_type_id, date_trunc('day', sold_at), SUM(amount), SUM(litres), COUNT(*),
+         SUM(price_at_sale * litres), SUM(price_at_sale), MIN(sold_at), MAX(sold_at)
+    FROM new_rows
+   GROUP BY 1, 2
+  ON CONFLICT (fuel_type_id, d) DO UPDATE
+     SET revenue       = sd.revenue + EXCLUDED.revenue,
+         litres        = sd.litres + EXCLUDED.litres,
+         tx_count      = sd.tx_count + EXCLUDED.tx_count,
+         wsum_price    = sd.wsum_price + EXCLUDED.wsum_price,
+         sum_price     = sd.sum_price + EXCLUDED.sum_price,
+         first_sale_at = LEAST(sd.first_sale_at, EXCLUDED.first_sale_at),
+         last_sale_at  = GREATEST(sd.last_sale_at, EXCLUDED.last_sale_at);
+  RETURN NULL;
+END
+$$;
+
+-- Install the trigger and backfill history atomically: the lock blocks sales
+-- inserts, so no sale can land between the backfill and the trigger (and be
+-- missed or counted twice). The backfill only runs while the trigger does not
+-- exist yet; from then on the trigger keeps sales_daily current.
+BEGIN;
+LOCK TABLE sales IN SHARE ROW EXCLUSIVE MODE;
+
+INSERT INTO sales_daily (fuel_type_id, d, revenue, litres, tx_count, wsum_price, sum_price, first_sale_at, last_sale_at)
+SELECT fuel_type_id, date_trunc('day', sold_at), SUM(amount), SUM(litres), COUNT(*),
+       SUM(price_at_sale * litres), SUM(price_at_sale), MIN(sold_at), MAX(sold_at)
+  FROM sales
+ WHERE NOT EXISTS (
+         SELECT 1 FROM pg_trigger
+          WHERE tgrelid = 'sales'::regclass AND tgname = 'trg_sales_daily')
+ GROUP BY 1, 2;
+
+DROP TRIGGER IF EXISTS trg_sales_daily ON sales;
+CREATE TRIGGER trg_sales_daily
+  AFTER INSERT ON sales
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION sales_daily_apply();
+COMMIT;
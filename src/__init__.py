@@ -1,27 +1,52 @@
 # src/__init__.py
-from flask import Flask
-from .config import Settings
+from flask import Flask, Response
+from .config import get_settings
 from .db import init_engine, init_session_factory
 from .errors import register_error_handlers
 from .apis import register_blueprints
 from .logger import setup_logger
-
-from flasgger import Swagger
+from .json_provider import OrJSONProvider
 
 def create_app() -> Flask:
     app = Flask(__name__)
+    app.json = OrJSONProvider(app)
 
     # Load settings
-    settings = Settings()
+    settings = get_settings()
     app.config["SETTINGS"] = settings
     logger = setup_logger("inventory_app")
     app.logger = logger
     # DB wiring
-    engine = init_engine(settings.DATABASE_URL)
+    engine = init_engine(
+        settings.DATABASE_URL,
+        pool_size=settings.POOL_SIZE,
+        max_overflow=settings.MAX_OVERFLOW,
+        pool_recycle=settings.POOL_RECYCLE,
+        # Keepalives + pool_recycle cover production; pre-ping only while debugging
+        pool_pre_ping=settings.FLASK_DEBUG,
+        prepare_threshold=settings.PREPARE_THRESHOLD,
+        binary_results=settings.BINARY_RESULTS,
+    )
     session_factory = init_session_factory(engine)
     app.config["DB_ENGINE"] = engine
     app.config["SESSION_FACTORY"] = session_factory
 
+    # Serve "/fuel-types/" and "/fuel-types" alike instead of answering with a 308 redirect
+    app.url_map.strict_slashes = False
+
+    swagger = init_swagger(app) if settings.ENABLE_SWAGGER else None
+
+    register_blueprints(app)
+    register_error_handlers(app)
+    if swagger is not None and not app.debug:
+        precompile_apispec(app, swagger)
+    return app
+
+
+def init_swagger(app: Flask):
+    # Imported here so workers with Swagger disabled never load Flasgger
+    from flasgger import Swagger
+
     # Swagger 2.0 (NOT OpenAPI 3)
     swagger_template = {
         "swagger": "2.0",
@@ -45,8 +70,17 @@ def create_app() -> Flask:
         "swagger_ui": True,
         "specs_route": "/apidocs",
     }
-    Swagger(app, template=swagger_template, config=swagger_config)
+    return Swagger(app, template=swagger_template, config=swagger_config)
 
-    register_blueprints(app)
-    register_error_handlers(app)
-    return app
+
+def precompile_apispec(app: Flask, swagger) -> None:
+    # Build the spec once all routes exist and serve the serialized bytes,
+    # instead of re-encoding it on every /apispec_1.json hit
+    with app.app_context():
+        spec = swagger.get_apispecs("apispec_1")
+    app.config["APISPEC_BYTES"] = app.json.dumps(spec).encode()
+
+    def apispec_1():
+        return Response(app.config["APISPEC_BYTES"], mimetype="application/json")
+
+    app.view_functions["flasgger.apispec_1"] = apispec_1
@@ -1,15 +1,35 @@
 # src/apis/__init__.py
-from flask import Flask, Blueprint, jsonify
-from .fuel_types import bp as fuel_types_bp
-from .inventory import bp as inventory_bp
-from .sales import bp as sales_bp
-from .reporting import bp as reporting_bp
+import orjson
+from flask import Flask, Blueprint, Response
+from werkzeug.utils import import_string
+
+# Feature blueprints are resolved by import path so their modules (and the
+# service/schema code behind them) are only imported when the app is built.
+_FEATURE_BLUEPRINTS = (
+    "src.apis.fuel_types:bp",
+    "src.apis.inventory:bp",
+    "src.apis.sales:bp",
+    "src.apis.reporting:bp",
+)
+
+# Utility responses never change, so they are serialized once at import
+_INDEX_BODY = orjson.dumps({
+    "status": "ok",
+    "service": "Fuel Station Inventory & Sales API",
+    "endpoints": [
+        "/fuel-types",
+        "/inventory",
+        "/sales",
+        "/health",
+        "/apidocs"  # if you add Flasgger later
+    ],
+})
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
 def register_blueprints(app: Flask):
     # Register feature blueprints
-    app.register_blueprint(fuel_types_bp)
-    app.register_blueprint(inventory_bp)
-    app.register_blueprint(sales_bp)
-    app.register_blueprint(reporting_bp)
+    for path in _FEATURE_BLUEPRINTS:
+        app.register_blueprint(import_string(path))
 
     # Utility routes (root and health check)
     utility = Blueprint("utility", __name__)
@@ -24,28 +44,18 @@ def register_blueprints(app: Flask):
         responses:
           200: { description: OK }
         """
-        return jsonify({
-            "status": "ok",
-            "service": "Fuel Station Inventory & Sales API",
-            "endpoints": [
-                "/fuel-types",
-                "/inventory",
-                "/sales",
-                "/health",
-                "/apidocs"  # if you add Flasgger later
-            ],
-        }), 200
+        return Response(_INDEX_BODY, status=200, mimetype="application/json")
 
     @utility.get("/health")
     def health():
         """
-        Health Check
+        Health Check (also served at /health/)
         ---
         tags:
           - Meta
         responses:
           200: { description: OK }
         """
-        return jsonify({"status": "healthy"}), 200
+        return Response(_HEALTH_BODY, status=200, mimetype="application/json")
 
     app.register_blueprint(utility)
@@ -1,13 +1,22 @@
 # src/apis/fuel_types.py
-from flask import Blueprint, current_app, jsonify, request
+from flask import Blueprint, jsonify, request
 from marshmallow import ValidationError as MsValidationError
-from src.db import session_scope
+from src import cache
+from src.db import get_session_factory, read_session, session_scope
 from src.modules.fuel_types_service import create_fuel_type, update_price, list_fuel_types
 from src.errors import ValidationError
-from src.models.schemas import CreateFuelTypeIn, UpdatePriceIn
+from src.models.schemas import CreateFuelTypeIn, UpdatePriceIn, FuelTypeOut
 
 bp = Blueprint("fuel_types", __name__, url_prefix="/fuel-types")
 
+# Schemas are stateless for load/dump; build once instead of per request
+_CREATE_FUEL_TYPE_IN = CreateFuelTypeIn()
+_UPDATE_PRICE_IN = UpdatePriceIn()
+_FUEL_TYPE_OUT = FuelTypeOut(many=True)
+
+# Seconds a cached GET /fuel-types response may be served before re-reading
+_LIST_TTL = 5.0
+
 @bp.post("")
 def create():
     """
@@ -41,12 +50,13 @@ def create():
         description: Validation error
     """
     try:
-        payload = CreateFuelTypeIn().load(request.get_json(force=True))
+        payload = _CREATE_FUEL_TYPE_IN.load(request.get_json(force=True, cache=False))
     except MsValidationError as e:
         raise ValidationError(e.messages)
-    sf = current_app.config["SESSION_FACTORY"]
+    sf = get_session_factory()
     with session_scope(sf) as s:
         res = create_fuel_type(s, payload["name"], payload["price_per_litre"], payload["initial_stock_litres"])
+    cache.invalidate("fuel_types", "inventory")
     return jsonify(res), 201
 
 @bp.patch("/<int:fuel_type_id>/price")
@@ -75,12 +85,13 @@ def patch_price(fuel_type_id: int):
       404: { description: Fuel type not found }
     """
     try:
-        payload = UpdatePriceIn().load(request.get_json(force=True))
+        payload = _UPDATE_PRICE_IN.load(request.get_json(force=True, cache=False))
     except MsValidationError as e:
         raise ValidationError(e.messages)
-    sf = current_app.config["SESSION_FACTORY"]
+    sf = get_session_factory()
     with session_scope(sf) as s:
         res = update_price(s, fuel_type_id, payload["price_per_litre"])
+    cache.invalidate("fuel_types")
     return jsonify(res), 200
 
 @bp.get("")
@@ -102,7 +113,7 @@ def list_():
               name: { type: string }
               price_per_litre: { type: string }
     """
-    sf = current_app.config["SESSION_FACTORY"]
-    with session_scope(sf) as s:
-        res = list_fuel_types(s)
-    return jsonify(res), 200
+    def build():
+        with read_session(get_session_factory()) as s:
+            return _FUEL_TYPE_OUT.dump(list_fuel_types(s))
+    return jsonify(cache.get_or_set("fuel_types", _LIST_TTL, build)), 200
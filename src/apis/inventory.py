@@ -1,13 +1,21 @@
 # src/apis/inventory.py
-from flask import Blueprint, current_app, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from marshmallow import ValidationError as MsValidationError
-from src.db import session_scope
+from src import cache
+from src.db import get_session_factory, read_session, session_scope
 from src.modules.inventory_service import refill_stock, list_inventory
 from src.errors import ValidationError
-from src.models.schemas import RefillStockIn
+from src.models.schemas import RefillStockIn, InventoryRowOut
 
 bp = Blueprint("inventory", __name__, url_prefix="/inventory")
 
+# Schemas are stateless for load/dump; build once instead of per request
+_REFILL_STOCK_IN = RefillStockIn()
+_INVENTORY_ROW_OUT = InventoryRowOut(many=True)
+
+# Stock moves with every sale, so inventory is only cached briefly
+_LIST_TTL = 1.0
+
 @bp.post("/refill")
 def refill():
     """
@@ -31,13 +39,15 @@ def refill():
       404: { description: Fuel type not found }
     """
     try:
-        payload = RefillStockIn().load(request.get_json(force=True))
+        payload = _REFILL_STOCK_IN.load(request.get_json(force=True, cache=False))
     except MsValidationError as e:
         raise ValidationError(e.messages)
-    sf = current_app.config["SESSION_FACTORY"]
+    sf = get_session_factory()
     with session_scope(sf) as s:
         res = refill_stock(s, payload["fuel_type_id"], payload["litres"])
-    return jsonify(res), 200
+    cache.invalidate("inventory")
+    # Already a JSON document built by Postgres
+    return Response(res, status=200, mimetype="application/json")
 
 @bp.get("")
 def get_inventory():
@@ -58,7 +68,7 @@ def get_inventory():
               name: { type: string }
               stock_litres: { type: string }
     """
-    sf = current_app.config["SESSION_FACTORY"]
-    with session_scope(sf) as s:
-        res = list_inventory(s)
-    return jsonify(res), 200
+    def build():
+        with read_session(get_session_factory()) as s:
+            return _INVENTORY_ROW_OUT.dump(list_inventory(s))
+    return jsonify(cache.get_or_set("inventory", _LIST_TTL, build)), 200
@@ -1,6 +1,6 @@
-from flask import Blueprint, current_app, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from marshmallow import ValidationError as MsValidationError
-from src.db import session_scope
+from src.db import get_session_factory, read_session
 from src.models.schemas import ReportQuery
 from src.modules.reporting_service import (
     sales_overview, sales_timeseries, sales_by_fuel_type, price_history
@@ -9,6 +9,9 @@ from src.errors import ValidationError
 
 bp = Blueprint("reporting", __name__, url_prefix="/reports")
 
+# Schemas are stateless for .load(); build once instead of per request
+_REPORT_QUERY = ReportQuery()
+
 @bp.get("/sales/overview")
 def get_sales_overview():
     """
@@ -33,11 +36,11 @@ def get_sales_overview():
         description: OK
     """
     try:
-        params = ReportQuery().load(request.args)
+        params = _REPORT_QUERY.load(request.args)
     except MsValidationError as e:
         raise ValidationError(e.messages)
-    sf = current_app.config["SESSION_FACTORY"]
-    with session_scope(sf) as s:
+    sf = get_session_factory()
+    with read_session(sf) as s:
         res = sales_overview(s, params.get("from_"), params.get("to"), params.get("fuel_type_id"))
     return jsonify(res), 200
 
@@ -74,14 +77,15 @@ def get_sales_timeseries():
     """
 
     try:
-        params = ReportQuery().load(request.args)
+        params = _REPORT_QUERY.load(request.args)
     except MsValidationError as e:
         raise ValidationError(e.messages)
-    sf = current_app.config["SESSION_FACTORY"]
-    with session_scope(sf) as s:
+    sf = get_session_factory()
+    with read_session(sf) as s:
         res = sales_timeseries(s, params.get("from_"), params.get("to"),
                                params.get("fuel_type_id"), params.get("granularity"))
-    return jsonify(res), 200
+    # Already a JSON document built by Postgres
+    return Response(res, status=200, mimetype="application/json")
 
 @bp.get("/sales/by-fuel-type")
 def get_sales_by_fuel_type():
@@ -104,13 +108,14 @@ def get_sales_by_fuel_type():
         description: OK
     """
     try:
-        params = ReportQuery().load(request.args)
+        params = _REPORT_QUERY.load(request.args)
     except MsValidationError as e:
         raise ValidationError(e.messages)
-    sf = current_app.config["SESSION_FACTORY"]
-    with session_scope(sf) as s:
+    sf = get_session_factory()
+    with read_session(sf) as s:
         res = sales_by_fuel_type(s, params.get("from_"), params.get("to"))
-    return jsonify(res), 200
+    # Already a JSON document built by Postgres
+    return Response(res, status=200, mimetype="application/json")
 
 @bp.get("/price/history")
 def get_price_history():
@@ -139,12 +144,12 @@ def get_price_history():
         description: Missing or invalid parameters
     """
     try:
-        params = ReportQuery().load(request.args)
+        params = _REPORT_QUERY.load(request.args)
     except MsValidationError as e:
         raise ValidationError(e.messages)
     if not params.get("fuel_type_id"):
         raise ValidationError("fuel_type_id is required")
-    sf = current_app.config["SESSION_FACTORY"]
-    with session_scope(sf) as s:
+    sf = get_session_factory()
+    with read_session(sf) as s:
         res = price_history(s, params["fuel_type_id"], params.get("from_"), params.get("to"))
     return jsonify(res), 200
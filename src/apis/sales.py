@@ -1,13 +1,20 @@
 # src/apis/sales.py
-from flask import Blueprint, current_app, jsonify, request
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
 from marshmallow import ValidationError as MsValidationError
-from src.db import session_scope
-from src.modules.sales_service import record_sale, list_sales
+from src import cache
+from src.db import get_session_factory, session_scope
+from src.modules.sales_service import record_sale, record_sales_bulk, iter_sales
 from src.errors import ValidationError
-from src.models.schemas import RecordSaleIn, SalesQuery
+from src.models.schemas import RecordSaleIn, RecordSalesBulkIn, SalesQuery, SaleOut
 
 bp = Blueprint("sales", __name__, url_prefix="/sales")
 
+# Schemas are stateless for load/dump; build once instead of per request
+_RECORD_SALE_IN = RecordSaleIn()
+_RECORD_SALES_BULK_IN = RecordSalesBulkIn()
+_SALES_QUERY = SalesQuery()
+_SALE_OUT = SaleOut(many=True)
+
 @bp.post("")
 def create_sale():
     """
@@ -32,12 +39,55 @@ def create_sale():
       409: { description: Insufficient stock }
     """
     try:
-        payload = RecordSaleIn().load(request.get_json(force=True))
+        payload = _RECORD_SALE_IN.load(request.get_json(force=True, cache=False))
     except MsValidationError as e:
         raise ValidationError(e.messages)
-    sf = current_app.config["SESSION_FACTORY"]
+    sf = get_session_factory()
     with session_scope(sf) as s:
         res = record_sale(s, payload["fuel_type_id"], payload["litres"])
+    cache.invalidate("inventory")
+    return jsonify(res), 201
+
+@bp.post("/bulk")
+def create_sales_bulk():
+    """
+    Record Sales (bulk)
+    ---
+    tags:
+      - Sales
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required: [items]
+          properties:
+            items:
+              type: array
+              minItems: 1
+              maxItems: 5000
+              items:
+                type: object
+                required: [fuel_type_id, litres]
+                properties:
+                  fuel_type_id: { type: integer, example: 1 }
+                  litres: { type: string, example: "50.000" }
+    responses:
+      201: { description: Created (all sales recorded) }
+      400: { description: Validation error }
+      404: { description: Fuel type not found (nothing recorded) }
+      409: { description: Insufficient stock (nothing recorded) }
+    """
+    try:
+        payload = _RECORD_SALES_BULK_IN.load(request.get_json(force=True, cache=False))
+    except MsValidationError as e:
+        raise ValidationError(e.messages)
+    items = [(it["fuel_type_id"], it["litres"]) for it in payload["items"]]
+    sf = get_session_factory()
+    with session_scope(sf) as s:
+        res = record_sales_bulk(s, items)
+    cache.invalidate("inventory")
     return jsonify(res), 201
 
 @bp.get("")
@@ -78,10 +128,27 @@ def list_():
               sold_at: { type: string }
     """
     try:
-        params = SalesQuery().load(request.args)
+        params = _SALES_QUERY.load(request.args)
     except MsValidationError as e:
         raise ValidationError(e.messages)
-    sf = current_app.config["SESSION_FACTORY"]
-    with session_scope(sf) as s:
-        res = list_sales(s, params.get("from_"), params.get("to"), params.get("fuel_type_id"))
-    return jsonify(res), 200
+    sf = get_session_factory()
+    dumps = current_app.json.dumps
+
+    # Emit the JSON array one cursor batch at a time instead of building the
+    # whole list. Server-side cursors need a transaction, hence session_scope;
+    # it also rolls back and closes on GeneratorExit when the client disconnects.
+    def generate():
+        with session_scope(sf) as s:
+            parts = iter_sales(s, params.get("from_"), params.get("to"), params.get("fuel_type_id"))
+            first = next(parts, [])
+            yield ""  # primed: session open and first batch fetched
+            yield "[" + dumps(_SALE_OUT.dump(first))[1:-1]
+            for part in parts:
+                yield "," + dumps(_SALE_OUT.dump(part))[1:-1]
+            yield "]"
+
+    gen = generate()
+    # Run up to the first batch now, so checkout/SQL failures still reach the
+    # error handlers as a 500 instead of breaking an already-started response
+    next(gen)
+    return Response(stream_with_context(gen), status=200, mimetype="application/json")
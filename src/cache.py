@@ -0,0 +1,51 @@
+# src/cache.py
+"""Process-local TTL cache for small, slowly-changing read responses.
+
+Each gunicorn worker keeps its own copy, so readers may see data up to
+``ttl`` seconds stale on workers that did not handle the write.
+"""
+import threading
+import time
+
+# Upper bound on entries; parameterised report keys are otherwise unbounded
+MAX_ENTRIES = 512
+
+# key -> (expires_at, value); dict order doubles as insertion (age) order
+_CACHE: dict = {}
+# Workers run several threads; guards every _CACHE read/write (never held across builder())
+_LOCK = threading.Lock()
+
+
+def get_or_set(key, ttl: float, builder):
+    """Return the cached value for ``key``, rebuilding it once ``ttl`` seconds have passed."""
+    now = time.monotonic()
+    with _LOCK:
+        entry = _CACHE.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    value = builder()
+    with _LOCK:
+        _CACHE.pop(key, None)
+        _CACHE[key] = (now + ttl, value)
+        if len(_CACHE) > MAX_ENTRIES:
+            _evict(now)
+    return value
+
+
+def _evict(now: float) -> None:
+    # Caller holds _LOCK
+    for key in [k for k, (expires_at, _) in list(_CACHE.items()) if expires_at <= now]:
+        _CACHE.pop(key, None)
+    while len(_CACHE) > MAX_ENTRIES:
+        _CACHE.pop(next(iter(_CACHE)), None)  # oldest first
+
+
+def invalidate(*keys) -> None:
+    with _LOCK:
+        for key in keys:
+            _CACHE.pop(key, None)
+
+
+def clear() -> None:
+    with _LOCK:
+        _CACHE.clear()
@@ -1,17 +1,64 @@
 # src/db.py
+import psycopg
+from psycopg.pq import Format
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
+from functools import lru_cache
+from flask import current_app
 
-def init_engine(db_url: str):
+# libpq TCP keepalives: dead sockets are detected out-of-band instead of
+# with a SELECT 1 round-trip on every pool checkout
+_KEEPALIVE_ARGS = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+}
+
+class BinaryCursor(psycopg.Cursor):
+    """Cursor that asks Postgres for binary-format results, so NUMERIC and
+    timestamp columns arrive fixed-width instead of being parsed from text."""
+
+    def __init__(self, connection, *, row_factory=None):
+        super().__init__(connection, row_factory=row_factory)
+        self.format = Format.BINARY
+
+def init_engine(db_url: str, pool_size: int = 25, max_overflow: int = 25, pool_recycle: int = 1800,
+                pool_pre_ping: bool = False, prepare_threshold: int | None = 1, binary_results: bool = True):
     # future=True is default in SA 2.x; echo can be toggled via env later
-    engine = create_engine(db_url, pool_pre_ping=True)
+    # LIFO checkout keeps a few hot connections in use instead of cycling through the whole pool
+    engine = create_engine(
+        db_url,
+        pool_pre_ping=pool_pre_ping,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_use_lifo=True,
+        # psycopg3 prepares a statement server-side once it has run this many
+        # times on a connection, so the small fixed set of service queries skip re-planning
+        connect_args={
+            **_KEEPALIVE_ARGS,
+            "prepare_threshold": prepare_threshold,
+            **({"cursor_factory": BinaryCursor} if binary_results else {}),
+        },
+    )
     return engine
 
 def init_session_factory(engine):
     return sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
 
+@lru_cache(maxsize=1)
+def _session_factory_for(app):
+    return app.config["SESSION_FACTORY"]
+
+def get_session_factory():
+    """Session factory of the active app, memoized per app object."""
+    return _session_factory_for(current_app._get_current_object())
+
+
 @contextmanager
 def session_scope(session_factory):
     session = session_factory()
@@ -23,3 +70,17 @@ def session_scope(session_factory):
         raise
     finally:
         session.close()
+
+
+@contextmanager
+def read_session(session_factory):
+    """Session for SELECT-only work: runs in autocommit, so there is no COMMIT round-trip."""
+    session = session_factory()
+    try:
+        # Sessions bound to an existing Connection (e.g. joined to an outer
+        # transaction) must stay inside it, so only engine-bound ones switch
+        if isinstance(session.get_bind(), Engine):
+            session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+        yield session
+    finally:
+        session.close()
@@ -19,40 +19,47 @@ class ConflictError(Exception):
     """Raised when a unique constraint or duplicate resource conflict occurs."""
 
 
-def register_error_handlers(app: Flask):
-    # ---- Domain errors ------------------------------------------------------
-    @app.errorhandler(NotFoundError)
-    def _not_found(e):
-        return jsonify(error={"code": "NOT_FOUND", "message": str(e)}), 404
-
-    @app.errorhandler(ValidationError)
-    def _bad_request(e):
-        return jsonify(error={"code": "BAD_REQUEST", "message": str(e)}), 400
-
-    @app.errorhandler(InsufficientStockError)
-    def _insufficient(e):
-        return jsonify(error={"code": "INSUFFICIENT_STOCK", "message": str(e)}), 409
-
-    @app.errorhandler(ConflictError)
-    def _conflict(e):
-        return jsonify(error={"code": "CONFLICT", "message": str(e)}), 409
-
-    # ---- Built-in Flask/Werkzeug HTTP errors (e.g., 404 on wrong URL) ------
-    @app.errorhandler(HTTPException)
-    def _http_exception(e: HTTPException):
-        return (
-            jsonify(
-                error={
-                    "code": e.name.replace(" ", "_").upper(),
-                    "message": e.description,
-                }
-            ),
-            e.code,
-        )
+# Domain error -> (HTTP status, error code). Expected errors are answered
+# straight from this table, without traceback logging.
+_DOMAIN_ERRORS = {
+    NotFoundError: (404, "NOT_FOUND"),
+    ValidationError: (400, "BAD_REQUEST"),
+    InsufficientStockError: (409, "INSUFFICIENT_STOCK"),
+    ConflictError: (409, "CONFLICT"),
+}
 
-    # ---- Unexpected errors (last resort) -----------------------------------
+
+def _lookup_domain_error(e: Exception):
+    # Exact type hits on the first MRO entry; subclasses still resolve
+    for cls in type(e).__mro__:
+        mapped = _DOMAIN_ERRORS.get(cls)
+        if mapped:
+            return mapped
+    return None
+
+
+def register_error_handlers(app: Flask):
     @app.errorhandler(Exception)
-    def _unhandled(e):
+    def _handle_error(e):
+        # ---- Domain errors --------------------------------------------------
+        mapped = _lookup_domain_error(e)
+        if mapped:
+            status, code = mapped
+            return jsonify(error={"code": code, "message": str(e)}), status
+
+        # ---- Built-in Flask/Werkzeug HTTP errors (e.g., 404 on wrong URL) --
+        if isinstance(e, HTTPException):
+            return (
+                jsonify(
+                    error={
+                        "code": e.name.replace(" ", "_").upper(),
+                        "message": e.description,
+                    }
+                ),
+                e.code,
+            )
+
+        # ---- Unexpected errors (last resort) -------------------------------
         # Log full stack for operators; keep client message generic
         try:
             app.logger.exception(
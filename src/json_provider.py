@@ -0,0 +1,17 @@
+# src/json_provider.py
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Decimals (NUMERIC columns) fall back to ``str`` so money/litre values keep
+    their exact representation, matching the schemas' ``as_string=True``.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
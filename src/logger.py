@@ -1,23 +1,65 @@
 import logging
+import logging.handlers
 import sys
+import time
 
-def setup_logger(name: str = "app"):
-    """Return a configured logger with JSON-like structured output."""
+import orjson
+
+
+class OrjsonFormatter(logging.Formatter):
+    """Render each record as one valid JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "level": record.levelname,
+            "time": self.formatTime(record, self.datefmt),
+            "name": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str).decode()
+
+
+class TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes once ``flush_interval`` seconds have passed."""
+
+    def __init__(self, capacity, flush_interval: float = 2.0, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return (
+            super().shouldFlush(record)
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
+    def flush(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+
+
+def setup_logger(name: str = "app", buffer_capacity: int = 1000, flush_interval: float = 2.0):
+    """Return a configured logger with JSON structured output.
+
+    Records are buffered in memory and written in batches. The buffer is
+    flushed on WARNING or above, when it is full, or once ``flush_interval``
+    seconds have passed since the last flush, so a killed worker loses at
+    most a few seconds of logs.
+    """
     logger = logging.getLogger(name)
 
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            fmt=(
-                '{"level": "%(levelname)s", '
-                '"time": "%(asctime)s", '
-                '"name": "%(name)s", '
-                '"message": "%(message)s"}'
-            ),
-            datefmt="%Y-%m-%dT%H:%M:%S",
+        handler.setFormatter(OrjsonFormatter(datefmt="%Y-%m-%dT%H:%M:%S"))
+        buffered = TimedMemoryHandler(
+            buffer_capacity,
+            flush_interval=flush_interval,
+            flushLevel=logging.WARNING,
+            target=handler,
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        logger.addHandler(buffered)
         logger.setLevel(logging.INFO)
 
     return logger
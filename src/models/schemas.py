@@ -1,26 +1,39 @@
 # src/apis/schemas.py
-from marshmallow import Schema, fields, validates, ValidationError, pre_load
+from marshmallow import Schema, fields, validate, validates, ValidationError, pre_load
 from decimal import Decimal
 
+# Shared Decimal constants (built once per process, not per schema/request)
+ZERO_LITRES = Decimal("0.000")
+
+# Lines per POST /sales/bulk; bounds how long one request holds its write transaction
+MAX_BULK_ITEMS = 5000
+
+def _is_negative(v: Decimal) -> bool:
+    # Sign/zero flag checks; no Decimal coercion of the right-hand side
+    return v.is_signed() and not v.is_zero()
+
+def _is_non_positive(v: Decimal) -> bool:
+    return v.is_signed() or v.is_zero()
+
 class CreateFuelTypeIn(Schema):
     name = fields.String(required=True)
     price_per_litre = fields.Decimal(required=True, as_string=True, places=3)
-    initial_stock_litres = fields.Decimal(load_default=Decimal("0.000"), as_string=True, places=3)
+    initial_stock_litres = fields.Decimal(load_default=ZERO_LITRES, as_string=True, places=3)
     
     @validates("price_per_litre")
     def _price_ge_0(self, v):
-        if v is None or v < 0: raise ValidationError("price_per_litre must be >= 0")
+        if v is None or _is_negative(v): raise ValidationError("price_per_litre must be >= 0")
 
     @validates("initial_stock_litres")
     def _stock_ge_0(self, v):
-        if v is None or v < 0: raise ValidationError("initial_stock_litres must be >= 0")
+        if v is None or _is_negative(v): raise ValidationError("initial_stock_litres must be >= 0")
 
 class UpdatePriceIn(Schema):
     price_per_litre = fields.Decimal(required=True, as_string=True, places=3)
 
     @validates("price_per_litre")
     def _price_ge_0(self, v):
-        if v < 0: raise ValidationError("price_per_litre must be >= 0")
+        if _is_negative(v): raise ValidationError("price_per_litre must be >= 0")
 
 class RefillStockIn(Schema):
     fuel_type_id = fields.Integer(required=True)
@@ -28,7 +41,7 @@ class RefillStockIn(Schema):
 
     @validates("litres")
     def _litres_gt_0(self, v):
-        if v <= 0: raise ValidationError("litres must be > 0")
+        if _is_non_positive(v): raise ValidationError("litres must be > 0")
 
 class RecordSaleIn(Schema):
     fuel_type_id = fields.Integer(required=True)
@@ -36,37 +49,59 @@ class RecordSaleIn(Schema):
 
     @validates("litres")
     def _litres_gt_0(self, v):
-        if v <= 0: raise ValidationError("litres must be > 0")
+        if _is_non_positive(v): raise ValidationError("litres must be > 0")
+
+# ---- Output schemas (list endpoints) ---------------------------------------
+class FuelTypeOut(Schema):
+    id = fields.Integer()
+    name = fields.String()
+    price_per_litre = fields.Decimal(as_string=True, places=3)
 
-class SalesQuery(Schema):
+class InventoryRowOut(Schema):
+    fuel_type_id = fields.Integer()
+    name = fields.String()
+    stock_litres = fields.Decimal(as_string=True, places=3)
+
+class SaleOut(Schema):
+    id = fields.Integer()
+    fuel_type_id = fields.Integer()
+    litres = fields.Decimal(as_string=True, places=3)
+    price_at_sale = fields.Decimal(as_string=True, places=3)
+    amount = fields.Decimal(as_string=True, places=2)
+    sold_at = fields.DateTime()
+
+# Suffixes that widen a bare YYYY-MM-DD into a full-day range
+_DAY_START = "T00:00:00"
+_DAY_END = "T23:59:59"
+
+class _DateRangeQuery(Schema):
     from_ = fields.DateTime(load_default=None, data_key="from")
     to = fields.DateTime(load_default=None, data_key="to")
     fuel_type_id = fields.Integer(load_default=None)
+
     @pre_load
     def parse_dates(self, data, **kwargs):
+        start, end = data.get("from"), data.get("to")
+        complete_start = isinstance(start, str) and len(start) == 10  # Only YYYY-MM-DD
+        complete_end = isinstance(end, str) and len(end) == 10
+        if not (complete_start or complete_end):
+            return data  # Nothing to rewrite; skip copying the query args
         # Convert ImmutableMultiDict to a mutable dict
         data = dict(data)
-        for key in ["from", "to"]:
-            if key in data and len(data[key]) == 10:  # Only YYYY-MM-DD
-                if key == "from":
-                    data[key] += "T00:00:00"
-                else:
-                    data[key] += "T23:59:59"
+        if complete_start:
+            data["from"] = start + _DAY_START
+        if complete_end:
+            data["to"] = end + _DAY_END
         return data
 
-class ReportQuery(Schema):
-    from_ = fields.DateTime(load_default=None, data_key="from")
-    to = fields.DateTime(load_default=None, data_key="to")
-    fuel_type_id = fields.Integer(load_default=None)
+class RecordSalesBulkIn(Schema):
+    items = fields.List(
+        fields.Nested(RecordSaleIn), required=True,
+        validate=validate.Length(min=1, max=MAX_BULK_ITEMS),
+    )
+
+class SalesQuery(_DateRangeQuery):
+    pass
+
+class ReportQuery(_DateRangeQuery):
     granularity = fields.String(load_default="day")  # day|week|month
-    @pre_load
-    def parse_dates(self, data, **kwargs):
-        # Convert ImmutableMultiDict to mutable dict
-        data = dict(data)
-        for key in ["from", "to"]:
-            if key in data and len(data[key]) == 10:  # YYYY-MM-DD
-                if key == "from":
-                    data[key] += "T00:00:00"
-                else:
-                    data[key] += "T23:59:59"
-        return data
@@ -14,34 +14,27 @@ def create_fuel_type(session, name, price_per_litre, initial_stock=0):
     if price < 0 or stock < 0:
         raise ValidationError("price/stock must be >= 0")
 
-    # 1) Pre-check existence by natural key (name)
-    exists = session.execute(
-        text("SELECT id FROM fuel_types WHERE name = :name"),
-        {"name": name}
-    ).scalar()
-
-    if exists:
-        # Do NOT upsert, do NOT modify existing price/stock here
-        raise ConflictError(f'Fuel type "{name}" already exists')
-
-    # 2) Fresh insert (price history + stock set) inside one tx
+    # Insert + initial price history in one round-trip. The UNIQUE(name)
+    # constraint detects duplicates, so there is no pre-check SELECT.
     row = session.execute(
         text("""
-        INSERT INTO fuel_types (name, price_per_litre, stock_litres)
-        VALUES (:name, :price, :stock)
-        RETURNING id, name, price_per_litre, stock_litres, created_at
+        WITH ins AS (
+          INSERT INTO fuel_types (name, price_per_litre, stock_litres)
+          VALUES (:name, :price, :stock)
+          ON CONFLICT (name) DO NOTHING
+          RETURNING id, name, price_per_litre, stock_litres, created_at
+        ), hist AS (
+          INSERT INTO fuel_price_history (fuel_type_id, price_per_litre, valid_from)
+          SELECT id, price_per_litre, NOW() FROM ins
+        )
+        SELECT id, name, price_per_litre, stock_litres, created_at FROM ins
         """),
         {"name": name, "price": price, "stock": stock}
     ).mappings().first()
 
-    # 3) Record initial price in history
-    session.execute(
-        text("""
-        INSERT INTO fuel_price_history (fuel_type_id, price_per_litre, valid_from)
-        VALUES (:id, :price, NOW())
-        """),
-        {"id": row["id"], "price": price}
-    )
+    if not row:
+        # Do NOT upsert, do NOT modify existing price/stock here
+        raise ConflictError(f'Fuel type "{name}" already exists')
 
     return {
         "id": row["id"],
@@ -56,28 +49,31 @@ def update_price(session: Session, fuel_type_id: int, new_price: Decimal) -> dic
     if new_price < 0:
         raise ValidationError("price must be >= 0")
 
-    # Close open history (if any), then update live price and insert history
-    session.execute(
-        text("UPDATE fuel_price_history SET valid_to = NOW() WHERE fuel_type_id = :id AND valid_to IS NULL"),
-        {"id": fuel_type_id}
-    )
-
+    # One round-trip: update live price, close the open history segment (if
+    # any) and open a new one. Both history CTEs key off `upd`, so nothing is
+    # written when the fuel type does not exist.
     row = session.execute(
         text("""
-        UPDATE fuel_types
-           SET price_per_litre = :price, updated_at = NOW()
-         WHERE id = :id
-        RETURNING id, name, price_per_litre, updated_at
+        WITH upd AS (
+          UPDATE fuel_types
+             SET price_per_litre = :price, updated_at = NOW()
+           WHERE id = :id
+          RETURNING id, name, price_per_litre, updated_at
+        ), closed AS (
+          UPDATE fuel_price_history h
+             SET valid_to = NOW()
+            FROM upd
+           WHERE h.fuel_type_id = upd.id AND h.valid_to IS NULL
+        ), ins AS (
+          INSERT INTO fuel_price_history (fuel_type_id, price_per_litre)
+          SELECT id, price_per_litre FROM upd
+        )
+        SELECT id, name, price_per_litre, updated_at FROM upd
         """),
         {"id": fuel_type_id, "price": new_price}
     ).mappings().first()
     if not row:
         raise NotFoundError("fuel type not found")
-
-    session.execute(
-        text("INSERT INTO fuel_price_history (fuel_type_id, price_per_litre) VALUES (:id, :price)"),
-        {"id": fuel_type_id, "price": new_price}
-    )
     return dict(row)
 
 def list_fuel_types(session: Session) -> list[dict]:
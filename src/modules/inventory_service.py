@@ -3,21 +3,22 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 from src.errors import NotFoundError, ValidationError
 
-def refill_stock(session: Session, fuel_type_id: int, litres: Decimal) -> dict:
+def refill_stock(session: Session, fuel_type_id: int, litres: Decimal) -> str:
+    """Returns the response body as JSON text, built by Postgres."""
     if litres <= 0:
         raise ValidationError("litres must be > 0")
-    row = session.execute(
+    body = session.execute(
         text("""
         UPDATE fuel_types
            SET stock_litres = stock_litres + :litres, updated_at = NOW()
          WHERE id = :id
-        RETURNING id, stock_litres
+        RETURNING json_build_object('fuel_type_id', id, 'new_stock_litres', stock_litres::text)::text
         """),
         {"id": fuel_type_id, "litres": litres}
-    ).mappings().first()
-    if not row:
+    ).scalar()
+    if body is None:
         raise NotFoundError("fuel type not found")
-    return {"fuel_type_id": row["id"], "new_stock_litres": row["stock_litres"]}
+    return body
 
 def list_inventory(session: Session) -> list[dict]:
     rows = session.execute(
@@ -1,47 +1,217 @@
 # src/modules/reporting_service.py
+import inspect
+from datetime import datetime, time, timedelta, timezone
+from functools import wraps
+from itertools import product
+
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from src import cache
+from src.utils.sql_filters import FILTER_FLAGS, filter_key, filter_params, where
+
 _GRANULARITIES = {"day": "day", "week": "week", "month": "month"}
 
+# Totals, weighted average and peak/low day in one statement; `filtered`
+# is referenced twice, so Postgres materializes it and scans sales once
+_OVERVIEW_TMPL = """
+  WITH filtered AS (
+    SELECT sold_at, amount, litres, price_at_sale FROM sales {where}
+  ), per_day AS (
+    SELECT date_trunc('day', sold_at) AS d, SUM(amount) AS rev
+    FROM filtered
+    GROUP BY d
+  ), agg AS (
+    SELECT
+      COALESCE(SUM(amount),0) AS revenue,
+      COALESCE(SUM(litres),0) AS litres,
+      COUNT(*) AS tx_count,
+      CASE WHEN SUM(litres) > 0 THEN SUM(price_at_sale * litres)/SUM(litres) ELSE 0 END AS weighted_avg_price,
+      MIN(sold_at) AS first_sale_at,
+      MAX(sold_at) AS last_sale_at
+    FROM filtered
+  ),
+  peak AS (SELECT d, rev FROM per_day ORDER BY rev DESC, d LIMIT 1),
+  low AS (SELECT d, rev FROM per_day ORDER BY rev ASC, d LIMIT 1)
+  SELECT agg.*, peak.d AS peak_d, peak.rev AS peak_rev, low.d AS low_d, low.rev AS low_rev
+    FROM agg
+    LEFT JOIN peak ON TRUE
+    LEFT JOIN low ON TRUE
+"""
+
+# NUMERIC aggregates are cast to text in SQL so rows are already JSON-ready
+_TIMESERIES_TMPL = """
+  SELECT date_trunc('{gran}', sold_at) AS period_start,
+         SUM(amount)::text AS revenue,
+         SUM(litres)::text AS litres,
+         COUNT(*) AS tx_count,
+         AVG(price_at_sale)::text AS avg_price
+    FROM sales {where}
+GROUP BY 1
+ORDER BY 1
+"""
+
+_BY_FUEL_TYPE_TMPL = """
+  SELECT s.fuel_type_id, ft.name,
+         SUM(s.amount)::text AS revenue,
+         SUM(s.litres)::text AS litres,
+         COUNT(*) AS tx_count,
+         AVG(s.price_at_sale)::text AS avg_price
+    FROM sales s
+    JOIN fuel_types ft ON ft.id = s.fuel_type_id
+    {where}
+GROUP BY s.fuel_type_id, ft.name
+ORDER BY SUM(s.amount) DESC
+"""
+
+# Return price segments overlapping the range
+_PRICE_HISTORY_TMPL = """
+  SELECT price_per_litre::text AS price_per_litre, valid_from, valid_to
+    FROM fuel_price_history
+    {where}
+ORDER BY valid_from
+"""
+
+# ---- Same reports served from the sales_daily rollup -----------------------
+_OVERVIEW_DAILY_TMPL = """
+  WITH filtered AS (
+    SELECT * FROM sales_daily {where}
+  ), per_day AS (
+    SELECT d, SUM(revenue) AS rev
+    FROM filtered
+    GROUP BY d
+  ), agg AS (
+    SELECT
+      COALESCE(SUM(revenue),0) AS revenue,
+      COALESCE(SUM(litres),0) AS litres,
+      COALESCE(SUM(tx_count),0) AS tx_count,
+      CASE WHEN SUM(litres) > 0 THEN SUM(wsum_price)/SUM(litres) ELSE 0 END AS weighted_avg_price,
+      MIN(first_sale_at) AS first_sale_at,
+      MAX(last_sale_at) AS last_sale_at
+    FROM filtered
+  ),
+  peak AS (SELECT d, rev FROM per_day ORDER BY rev DESC, d LIMIT 1),
+  low AS (SELECT d, rev FROM per_day ORDER BY rev ASC, d LIMIT 1)
+  SELECT agg.*, peak.d AS peak_d, peak.rev AS peak_rev, low.d AS low_d, low.rev AS low_rev
+    FROM agg
+    LEFT JOIN peak ON TRUE
+    LEFT JOIN low ON TRUE
+"""
+
+_TIMESERIES_DAILY_TMPL = """
+  SELECT date_trunc('{gran}', d) AS period_start,
+         SUM(revenue)::text AS revenue,
+         SUM(litres)::text AS litres,
+         SUM(tx_count)::bigint AS tx_count,
+         (SUM(sum_price) / SUM(tx_count))::text AS avg_price
+    FROM sales_daily {where}
+GROUP BY 1
+ORDER BY 1
+"""
+
+_BY_FUEL_TYPE_DAILY_TMPL = """
+  SELECT sd.fuel_type_id, ft.name,
+         SUM(sd.revenue)::text AS revenue,
+         SUM(sd.litres)::text AS litres,
+         SUM(sd.tx_count)::bigint AS tx_count,
+         (SUM(sd.sum_price) / SUM(sd.tx_count))::text AS avg_price
+    FROM sales_daily sd
+    JOIN fuel_types ft ON ft.id = sd.fuel_type_id
+    {where}
+GROUP BY sd.fuel_type_id, ft.name
+ORDER BY SUM(sd.revenue) DESC
+"""
+
+# List reports are rendered to a JSON array by Postgres; the service hands the
+# text straight to the response, skipping per-row dicts and re-serialization
+def _json_array(tmpl: str, order: str) -> str:
+    return f"SELECT COALESCE(json_agg(t ORDER BY {order}), '[]')::text FROM ({tmpl}) t"
+
+_TS_ORDER = "t.period_start"
+_BFT_ORDER = "t.revenue::numeric DESC"
+
+def _use_daily(start, end) -> bool:
+    """
+    The rollup answers a range exactly only when it is made of whole days: no
+    upper bound (the inclusive `sold_at <= end` never lines up with a day
+    edge) and a start, if any, at midnight in the database's time zone.
+    """
+    if end:
+        return False
+    return not start or (start.tzinfo is None and start.time() == time(0))
+
+def _price_history_where(has_start, has_end):
+    clauses = ["fuel_type_id = :ftid"]
+    if has_start: clauses.append("(valid_to IS NULL OR valid_to >= :start)")
+    if has_end: clauses.append("valid_from <= :end")
+    return "WHERE " + " AND ".join(clauses)
+
+_FLAGS_2 = list(product((False, True), repeat=2))
+
+_OVERVIEW_SQL = {f: text(_OVERVIEW_TMPL.format(where=where(*f))) for f in FILTER_FLAGS}
+_TIMESERIES_SQL = {
+    (gran, *f): text(_json_array(_TIMESERIES_TMPL.format(gran=gran, where=where(*f)), _TS_ORDER))
+    for gran in _GRANULARITIES.values() for f in FILTER_FLAGS
+}
+_BY_FUEL_TYPE_SQL = {
+    f: text(_json_array(_BY_FUEL_TYPE_TMPL.format(where=where(*f, col="s.sold_at")), _BFT_ORDER))
+    for f in _FLAGS_2
+}
+_PRICE_HISTORY_SQL = {f: text(_PRICE_HISTORY_TMPL.format(where=_price_history_where(*f))) for f in _FLAGS_2}
+
+# Rollup variants; only start/fuel-type filters apply (see _use_daily)
+_FLAGS_START_FTID = [(has_start, False, has_ftid) for has_start, has_ftid in _FLAGS_2]
+_OVERVIEW_DAILY_SQL = {f: text(_OVERVIEW_DAILY_TMPL.format(where=where(*f, col="d"))) for f in _FLAGS_START_FTID}
+_TIMESERIES_DAILY_SQL = {
+    (gran, *f): text(_json_array(_TIMESERIES_DAILY_TMPL.format(gran=gran, where=where(*f, col="d")), _TS_ORDER))
+    for gran in _GRANULARITIES.values() for f in _FLAGS_START_FTID
+}
+_BY_FUEL_TYPE_DAILY_SQL = {
+    f[:2]: text(_json_array(_BY_FUEL_TYPE_DAILY_TMPL.format(where=where(*f, col="sd.d")), _BFT_ORDER))
+    for f in _FLAGS_START_FTID if not f[2]
+}
+
+# Seconds a report for an already-closed window is served from memory
+_REPORT_TTL = 60.0
+# Slack for transactions still in flight: sold_at is set at statement time
+# but only becomes visible at COMMIT
+_SETTLE = timedelta(minutes=1)
+# Naive bounds are read in the database's time zone, which may be up to
+# UTC+14; treat them as ending that much later to stay on the safe side
+_MAX_UTC_OFFSET = timedelta(hours=14)
+
+def _window_closed(end) -> bool:
+    if end is None:
+        return False
+    if end.tzinfo is None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return end + _MAX_UTC_OFFSET < now - _SETTLE
+    return end < datetime.now(timezone.utc) - _SETTLE
+
+def _cached_report(fn):
+    """
+    Memoize a sales report per argument set, but only for windows that ended
+    in the past: no new sale can land in them, so every worker may keep its
+    copy without invalidation. Windows reaching now (or open-ended) always
+    hit the database.
+    """
+    sig = inspect.signature(fn)
+
+    @wraps(fn)
+    def wrapper(session, *args, **kwargs):
+        bound = sig.bind(session, *args, **kwargs)
+        bound.apply_defaults()
+        if not _window_closed(bound.arguments["end"]):
+            return fn(session, *args, **kwargs)
+        key = (fn.__name__, *list(bound.arguments.values())[1:])
+        return cache.get_or_set(key, _REPORT_TTL, lambda: fn(session, *args, **kwargs))
+    return wrapper
+
+@_cached_report
 def sales_overview(session: Session, start=None, end=None, fuel_type_id=None) -> dict:
-    clauses, params = [], {}
-    if start: clauses.append("sold_at >= :start"); params["start"] = start
-    if end: clauses.append("sold_at <= :end"); params["end"] = end
-    if fuel_type_id: clauses.append("fuel_type_id = :ftid"); params["ftid"] = fuel_type_id
-    where = "WHERE " + " AND ".join(clauses) if clauses else ""
-
-    # Totals & weighted averages
-    q = text(f"""
-      SELECT
-        COALESCE(SUM(amount),0) AS revenue,
-        COALESCE(SUM(litres),0) AS litres,
-        COUNT(*) AS tx_count,
-        CASE WHEN SUM(litres) > 0 THEN SUM(price_at_sale * litres)/SUM(litres) ELSE 0 END AS weighted_avg_price,
-        MIN(sold_at) AS first_sale_at,
-        MAX(sold_at) AS last_sale_at
-      FROM sales {where}
-    """)
-    o = session.execute(q, params).mappings().first()
-
-    # Peak & low day by revenue
-    q2 = text(f"""
-      SELECT date_trunc('day', sold_at) AS d, SUM(amount) AS rev
-      FROM sales {where}
-      GROUP BY d
-      ORDER BY rev DESC
-      LIMIT 1
-    """)
-    peak = session.execute(q2, params).mappings().first()
-
-    q3 = text(f"""
-      SELECT date_trunc('day', sold_at) AS d, SUM(amount) AS rev
-      FROM sales {where}
-      GROUP BY d
-      ORDER BY rev ASC
-      LIMIT 1
-    """)
-    low = session.execute(q3, params).mappings().first()
+    key = filter_key(start, end, fuel_type_id)
+    q = _OVERVIEW_DAILY_SQL[key] if _use_daily(start, end) else _OVERVIEW_SQL[key]
+    o = session.execute(q, filter_params(start, end, fuel_type_id)).mappings().first()
 
     return {
       "total_revenue": str(o["revenue"]),
@@ -51,65 +221,28 @@ def sales_overview(session: Session, start=None, end=None, fuel_type_id=None) ->
       "weighted_avg_price": str(o["weighted_avg_price"]),
       "first_sale_at": o["first_sale_at"],
       "last_sale_at": o["last_sale_at"],
-      "peak_day": {"date": peak["d"], "revenue": str(peak["rev"])} if peak else None,
-      "low_day": {"date": low["d"], "revenue": str(low["rev"])} if low else None,
+      "peak_day": {"date": o["peak_d"], "revenue": str(o["peak_rev"])} if o["peak_d"] is not None else None,
+      "low_day": {"date": o["low_d"], "revenue": str(o["low_rev"])} if o["low_d"] is not None else None,
     }
 
-def sales_timeseries(session: Session, start=None, end=None, fuel_type_id=None, granularity="day") -> list[dict]:
+@_cached_report
+def sales_timeseries(session: Session, start=None, end=None, fuel_type_id=None, granularity="day") -> str:
+    """JSON array text, one object per period."""
     gran = _GRANULARITIES.get(granularity, "day")
-    clauses, params = [], {}
-    if start: clauses.append("sold_at >= :start"); params["start"] = start
-    if end: clauses.append("sold_at <= :end"); params["end"] = end
-    if fuel_type_id: clauses.append("fuel_type_id = :ftid"); params["ftid"] = fuel_type_id
-    where = "WHERE " + " AND ".join(clauses) if clauses else ""
-    q = text(f"""
-      SELECT date_trunc('{gran}', sold_at) AS bucket,
-             SUM(amount) AS revenue,
-             SUM(litres) AS litres,
-             COUNT(*) AS tx_count,
-             AVG(price_at_sale) AS avg_price
-        FROM sales {where}
-    GROUP BY bucket
-    ORDER BY bucket
-    """)
-    rows = session.execute(q, params).mappings().all()
-    return [{"period_start": r["bucket"], "revenue": str(r["revenue"]), "litres": str(r["litres"]),
-             "tx_count": int(r["tx_count"]), "avg_price": str(r["avg_price"])} for r in rows]
-
-def sales_by_fuel_type(session: Session, start=None, end=None) -> list[dict]:
-    clauses, params = [], {}
-    if start: clauses.append("s.sold_at >= :start"); params["start"] = start
-    if end: clauses.append("s.sold_at <= :end"); params["end"] = end
-    where = "WHERE " + " AND ".join(clauses) if clauses else ""
-    q = text(f"""
-      SELECT s.fuel_type_id, ft.name,
-             SUM(s.amount) AS revenue,
-             SUM(s.litres) AS litres,
-             COUNT(*) AS tx_count,
-             AVG(s.price_at_sale) AS avg_price
-        FROM sales s
-        JOIN fuel_types ft ON ft.id = s.fuel_type_id
-        {where}
-    GROUP BY s.fuel_type_id, ft.name
-    ORDER BY revenue DESC
-    """)
-    rows = session.execute(q, params).mappings().all()
-    return [{"fuel_type_id": r["fuel_type_id"], "name": r["name"],
-             "revenue": str(r["revenue"]), "litres": str(r["litres"]),
-             "tx_count": int(r["tx_count"]), "avg_price": str(r["avg_price"])} for r in rows]
+    key = (gran, *filter_key(start, end, fuel_type_id))
+    q = _TIMESERIES_DAILY_SQL[key] if _use_daily(start, end) else _TIMESERIES_SQL[key]
+    return session.execute(q, filter_params(start, end, fuel_type_id)).scalar_one()
+
+@_cached_report
+def sales_by_fuel_type(session: Session, start=None, end=None) -> str:
+    """JSON array text, one object per fuel type, highest revenue first."""
+    key = (bool(start), bool(end))
+    q = _BY_FUEL_TYPE_DAILY_SQL[key] if _use_daily(start, end) else _BY_FUEL_TYPE_SQL[key]
+    return session.execute(q, filter_params(start, end)).scalar_one()
 
 def price_history(session: Session, fuel_type_id: int, start=None, end=None) -> list[dict]:
-    # Return price segments overlapping the range
-    clauses = ["fuel_type_id = :ftid"]; params = {"ftid": fuel_type_id}
-    if start: clauses.append("(valid_to IS NULL OR valid_to >= :start)"); params["start"] = start
-    if end: clauses.append("valid_from <= :end"); params["end"] = end
-    where = "WHERE " + " AND ".join(clauses)
-    q = text(f"""
-      SELECT price_per_litre, valid_from, valid_to
-        FROM fuel_price_history
-        {where}
-    ORDER BY valid_from
-    """)
+    q = _PRICE_HISTORY_SQL[(bool(start), bool(end))]
+    params = filter_params(start, end)
+    params["ftid"] = fuel_type_id
     rows = session.execute(q, params).mappings().all()
-    return [{"price_per_litre": str(r["price_per_litre"]),
-             "valid_from": r["valid_from"], "valid_to": r["valid_to"]} for r in rows]
+    return [dict(r) for r in rows]
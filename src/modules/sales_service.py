@@ -2,12 +2,15 @@ from decimal import Decimal
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from src.errors import NotFoundError, InsufficientStockError, ValidationError
+from src.utils.sql_filters import FILTER_FLAGS, filter_key, filter_params, where
 
 def record_sale(session: Session, fuel_type_id: int, litres: Decimal) -> dict:
     if litres <= 0:
         raise ValidationError("litres must be > 0")
 
-    # Atomic stock decrement + sale insert; fails if insufficient stock
+    # Atomic stock decrement + sale insert. `ft` is joined in so the failure
+    # case still returns a row (all NULL sale columns) when the fuel type
+    # exists: no row -> not found, NULL id -> insufficient stock.
     row = session.execute(
         text("""
         WITH updated AS (
@@ -17,36 +20,104 @@ def record_sale(session: Session, fuel_type_id: int, litres: Decimal) -> dict:
            WHERE id = :fuel_type_id
              AND stock_litres >= :litres
           RETURNING id, price_per_litre
+        ), ins AS (
+          INSERT INTO sales (fuel_type_id, litres, price_at_sale, amount)
+          SELECT id, :litres, price_per_litre, (:litres * price_per_litre)
+            FROM updated
+          RETURNING id, fuel_type_id, litres, price_at_sale, amount, sold_at
         )
-        INSERT INTO sales (fuel_type_id, litres, price_at_sale, amount)
-        SELECT id, :litres, price_per_litre, (:litres * price_per_litre)
-          FROM updated
-        RETURNING id, fuel_type_id, litres, price_at_sale, amount, sold_at
+        SELECT ins.*
+          FROM (SELECT 1 FROM fuel_types WHERE id = :fuel_type_id) ft
+          LEFT JOIN ins ON TRUE
         """),
         {"fuel_type_id": fuel_type_id, "litres": litres}
     ).mappings().first()
 
     if not row:
-        exists = session.execute(text("SELECT 1 FROM fuel_types WHERE id = :id"), {"id": fuel_type_id}).first()
-        if not exists:
-            raise NotFoundError("fuel type not found")
+        raise NotFoundError("fuel type not found")
+    if row["id"] is None:
         raise InsufficientStockError("insufficient stock")
 
     return dict(row)
 
+# Rows per bulk statement; larger batches stop paying off on Postgres
+_BULK_BATCH = 1000
+
+_BULK_SALES_SQL = text("""
+    WITH items AS (
+      SELECT *
+        FROM unnest(CAST(:ids AS bigint[]), CAST(:litres AS numeric[])) WITH ORDINALITY
+          AS t(fuel_type_id, litres, ord)
+    ), totals AS (
+      SELECT fuel_type_id, SUM(litres) AS litres FROM items GROUP BY fuel_type_id
+    ), updated AS (
+      UPDATE fuel_types ft
+         SET stock_litres = ft.stock_litres - t.litres,
+             updated_at = NOW()
+        FROM totals t
+       WHERE ft.id = t.fuel_type_id
+         AND ft.stock_litres >= t.litres
+      RETURNING ft.id, ft.price_per_litre
+    )
+    INSERT INTO sales (fuel_type_id, litres, price_at_sale, amount)
+    SELECT i.fuel_type_id, i.litres, u.price_per_litre, (i.litres * u.price_per_litre)
+      FROM items i
+      JOIN updated u ON u.id = i.fuel_type_id
+     ORDER BY i.ord
+    RETURNING id, fuel_type_id, litres, price_at_sale, amount, sold_at
+""")
+
+def record_sales_bulk(session: Session, items: list[tuple[int, Decimal]]) -> list[dict]:
+    """
+    Record many sales with one statement per batch of up to 1000 rows.
+    All-or-nothing: litres for the same fuel type are summed and checked
+    against stock together, and any unknown fuel type or shortfall raises,
+    leaving the caller's transaction to roll back.
+    """
+    if any(litres <= 0 for _, litres in items):
+        raise ValidationError("litres must be > 0")
+
+    results = []
+    for i in range(0, len(items), _BULK_BATCH):
+        batch = items[i:i + _BULK_BATCH]
+        rows = session.execute(
+            _BULK_SALES_SQL,
+            {"ids": [fid for fid, _ in batch], "litres": [litres for _, litres in batch]},
+        ).mappings().all()
+
+        if len(rows) != len(batch):
+            wanted = {fid for fid, _ in batch}
+            found = set(session.execute(
+                text("SELECT id FROM fuel_types WHERE id = ANY(:ids)"), {"ids": list(wanted)}
+            ).scalars())
+            if wanted - found:
+                raise NotFoundError("fuel type not found")
+            raise InsufficientStockError("insufficient stock")
+
+        results.extend(dict(r) for r in sorted(rows, key=lambda r: r["id"]))
+    return results
+
+# Rows fetched per server-side cursor round-trip when listing sales
+_LIST_BATCH = 1000
+
+_LIST_SALES_SQL = {
+    f: text(f"SELECT id, fuel_type_id, litres, price_at_sale, amount, sold_at FROM sales {where(*f)} ORDER BY sold_at DESC")
+    for f in FILTER_FLAGS
+}
+
+def iter_sales(session: Session, start=None, end=None, fuel_type_id=None):
+    """
+    Yield matching sales as lists of at most `_LIST_BATCH` dicts, read through a
+    server-side cursor so only one batch is held in memory at a time. The
+    session must be inside a transaction (server-side cursors need one).
+    """
+    result = session.execute(
+        _LIST_SALES_SQL[filter_key(start, end, fuel_type_id)],
+        filter_params(start, end, fuel_type_id),
+        execution_options={"yield_per": _LIST_BATCH},
+    )
+    for part in result.mappings().partitions(_LIST_BATCH):
+        yield [dict(r) for r in part]
+
 def list_sales(session: Session, start=None, end=None, fuel_type_id=None) -> list[dict]:
-    clauses = []
-    params = {}
-    if start:
-        clauses.append("sold_at >= :start"); params["start"] = start
-    if end:
-        clauses.append("sold_at <= :end"); params["end"] = end
-    if fuel_type_id:
-        clauses.append("fuel_type_id = :ftid"); params["ftid"] = fuel_type_id
-
-    where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
-    rows = session.execute(
-        text(f"SELECT id, fuel_type_id, litres, price_at_sale, amount, sold_at FROM sales {where} ORDER BY sold_at DESC"),
-        params
-    ).mappings().all()
-    return [dict(r) for r in rows]
+    return [row for part in iter_sales(session, start, end, fuel_type_id) for row in part]
@@ -1,10 +1,19 @@
 # src/utils/decimal_utils.py
-from decimal import Decimal, getcontext, ROUND_HALF_UP
+from decimal import Context, Decimal, ROUND_HALF_UP
 
-getcontext().prec = 28
-getcontext().rounding = ROUND_HALF_UP
+# Explicit context for money/litre values instead of mutating the (thread-local)
+# global one on import. 18 digits covers the widest column, NUMERIC(18,x).
+MONEY_CTX = Context(prec=18, rounding=ROUND_HALF_UP)
 
 def to_decimal(val) -> Decimal:
+    # Exact-type fast paths first; Decimal takes ints directly, no str() round-trip
+    t = type(val)
+    if t is Decimal:
+        return val
+    if t is int:
+        return MONEY_CTX.create_decimal(val)
+    if t is float:
+        return MONEY_CTX.create_decimal(repr(val))  # shortest repr, not the binary expansion
     if isinstance(val, Decimal):
         return val
-    return Decimal(str(val))
+    return MONEY_CTX.create_decimal(str(val))
@@ -0,0 +1,27 @@
+# src/utils/sql_filters.py
+"""Shared start/end/fuel-type filters for the sales listing and reports.
+
+Every query takes the same small set of optional filters, so callers render
+one statement per (has_start, has_end, has_ftid) combination at import and
+pick it per request with `filter_key`; only the bind parameters vary.
+"""
+from itertools import product
+
+FILTER_FLAGS = list(product((False, True), repeat=3))
+
+def where(has_start, has_end, has_ftid=False, col="sold_at", ftid_col="fuel_type_id") -> str:
+    clauses = []
+    if has_start: clauses.append(f"{col} >= :start")
+    if has_end: clauses.append(f"{col} <= :end")
+    if has_ftid: clauses.append(f"{ftid_col} = :ftid")
+    return "WHERE " + " AND ".join(clauses) if clauses else ""
+
+def filter_key(start=None, end=None, fuel_type_id=None) -> tuple:
+    return (bool(start), bool(end), bool(fuel_type_id))
+
+def filter_params(start=None, end=None, fuel_type_id=None) -> dict:
+    params = {}
+    if start: params["start"] = start
+    if end: params["end"] = end
+    if fuel_type_id: params["ftid"] = fuel_type_id
+    return params
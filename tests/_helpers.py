@@ -0,0 +1,25 @@
+# tests/_helpers.py
+from decimal import Decimal
+
+from src.db import session_scope
+from src.modules.fuel_types_service import create_fuel_type, update_price
+from src.modules.sales_service import record_sale
+
+def by_id(items, key="fuel_type_id"):
+    """Index a list response by `key` for direct lookups."""
+    return {x[key]: x for x in items}
+
+def seed_fuel(app, name="Diesel", price="90.000", stock="100.000", steps=()) -> int:
+    """
+    Create a fuel type and replay `steps` straight through the services,
+    skipping the HTTP stack; for setup that no test is asserting on.
+    Each step is ("sale", litres) or ("price", new_price). Returns the id.
+    """
+    with session_scope(app.config["SESSION_FACTORY"]) as s:
+        fid = create_fuel_type(s, name, Decimal(price), Decimal(stock))["id"]
+        for kind, value in steps:
+            if kind == "sale":
+                record_sale(s, fid, Decimal(value))
+            else:
+                update_price(s, fid, Decimal(value))
+    return fid
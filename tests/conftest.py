@@ -1,72 +1,164 @@
 # tests/conftest.py
+import logging
 import os
 import pathlib
 import pytest
+from contextlib import contextmanager
 from flask import Flask
-from sqlalchemy import create_engine, text
+from psycopg.pq import Format
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
 
-from src import create_app
+# Under pytest-xdist every worker gets its own database (<name>_gw0, ...), so
+# one worker's truncating tests never wipe another's rows. This must happen
+# before `src` is imported: Settings reads DATABASE_URL at import time.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+_BASE_DATABASE_URL = os.environ.get("DATABASE_URL")
+if _XDIST_WORKER and _BASE_DATABASE_URL:
+    _url = make_url(_BASE_DATABASE_URL)
+    os.environ["DATABASE_URL"] = _url.set(
+        database=f"{_url.database}_{_XDIST_WORKER}"
+    ).render_as_string(hide_password=False)
+
+from src import cache, create_app
+from src.db import _session_factory_for
+from tests._helpers import seed_fuel
 
 SQL_PATH = str(pathlib.Path(__file__).resolve().parents[1] / "sql" / "001_init.sql")
 
-def _bootstrap_schema(database_url: str):
+def _bootstrap_schema(engine):
     """
     Execute the DDL file directly via SQLAlchemy/psycopg.
     Avoids requiring `psql` inside the app container.
     Safe to run multiple times (your SQL is idempotent with IF NOT EXISTS).
     """
-    engine = create_engine(database_url, future=True)
     ddl = pathlib.Path(SQL_PATH).read_text(encoding="utf-8")
-    # exec_driver_sql allows multiple semicolon-separated statements
-    with engine.begin() as conn:
-        conn.exec_driver_sql(ddl)
+    # Multiple semicolon-separated statements need psycopg's simple query
+    # protocol, which only text-format cursors use (the app's are binary).
+    # Autocommit, like psql: the script manages its own transaction.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        cur = conn.connection.driver_connection.cursor()
+        cur.format = Format.TEXT
+        cur.execute(ddl)
+
+def _ensure_worker_database():
+    """Create this xdist worker's database on first use (CREATE DATABASE has no IF NOT EXISTS)."""
+    if not (_XDIST_WORKER and _BASE_DATABASE_URL):
+        return
+    name = make_url(os.environ["DATABASE_URL"]).database
+    admin = create_engine(_BASE_DATABASE_URL, isolation_level="AUTOCOMMIT")
+    try:
+        with admin.connect() as conn:
+            exists = conn.execute(text("SELECT 1 FROM pg_database WHERE datname = :n"), {"n": name}).first()
+            if not exists:
+                conn.exec_driver_sql(f'CREATE DATABASE "{name}"')
+    finally:
+        admin.dispose()
+
+def _skip_commit_fsync(dbapi_conn, _record):
+    # Test data is disposable: don't wait for the WAL flush on each COMMIT
+    dbapi_conn.execute("SET synchronous_commit TO off")
+    dbapi_conn.commit()
 
 @pytest.fixture(scope="session")
 def app() -> Flask:
+    _ensure_worker_database()
     app = create_app()
+    app.config.update(TESTING=True)
+    # Only warnings and errors (e.g. the 500 handler's traceback) are worth emitting in tests
+    app.logger.setLevel(logging.WARNING)
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    event.listen(app.config["DB_ENGINE"], "connect", _skip_commit_fsync)
 
-    # Ensure we point at the test DB
-    db_url = app.config["SETTINGS"].DATABASE_URL
-    # If your runtime URL is postgresql+psycopg://... keep it as-is.
-    # No need to strip +psycopg; SQLAlchemy understands it.
-
+    # Reuse the app's engine (and its pool) for all fixture SQL; it already
+    # points at DATABASE_URL, so no extra engines are built per test.
     # Bootstrap schema without calling external psql
-    _bootstrap_schema(db_url)
+    _bootstrap_schema(app.config["DB_ENGINE"])
 
     return app
 
 
-@pytest.fixture(autouse=True)
-def clean_db(app):
-    """Truncate all domain tables before each test and reset identities."""
-    db_url = app.config["SETTINGS"].DATABASE_URL
-    engine = create_engine(db_url, future=True)
-    with engine.begin() as conn:
-        # Order doesn’t matter with TRUNCATE ... CASCADE, but we reset IDs.
-        conn.exec_driver_sql("""
-            TRUNCATE TABLE
-              sales,
-              fuel_price_history,
-              fuel_types
-            RESTART IDENTITY CASCADE;
-        """)
+# Tests never rely on fixed ids, so sequences are left alone (no RESTART IDENTITY)
+_TRUNCATE_SQL = "TRUNCATE TABLE sales_daily, sales, fuel_price_history, fuel_types CASCADE"
+
+def _truncate(app):
+    with app.config["DB_ENGINE"].begin() as conn:
+        conn.exec_driver_sql(_TRUNCATE_SQL)
+
+@contextmanager
+def _rolled_back(app):
+    """
+    Join every app session to one outer transaction that is rolled back at
+    teardown (SQLAlchemy's "join a Session into an external transaction").
+    Service commits only release SAVEPOINTs, so nothing reaches the tables.
+    """
+    conn = app.config["DB_ENGINE"].connect()
+    trans = conn.begin()
+    original = app.config["SESSION_FACTORY"]
+    app.config["SESSION_FACTORY"] = sessionmaker(
+        bind=conn, autoflush=False, join_transaction_mode="create_savepoint"
+    )
+    _session_factory_for.cache_clear()
+    try:
+        yield
+    finally:
+        app.config["SESSION_FACTORY"] = original
+        _session_factory_for.cache_clear()
+        trans.rollback()
+        conn.close()
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "no_db: test never touches the database; skip per-test DB isolation")
 
 @pytest.fixture(scope="session", autouse=True)
 def wipe_once(app):
-    db_url = app.config["SETTINGS"].DATABASE_URL
-    engine = create_engine(db_url, future=True)
-    with engine.begin() as conn:
-        conn.exec_driver_sql("""
-            TRUNCATE TABLE
-              sales,
-              fuel_price_history,
-              fuel_types
-            RESTART IDENTITY CASCADE;
-        """)
+    """Start the session from empty tables, whatever a previous run left behind."""
+    _truncate(app)
 
+@pytest.fixture(scope="session", autouse=True)
+def warm_routes(app, wipe_once):
+    """
+    Hit every parameterless GET route once, so first-use costs (the
+    apispec, flasgger assets, pooled connections and their prepared
+    statements) land here instead of in whichever test runs first.
+    """
+    with app.test_client() as c:
+        for rule in app.url_map.iter_rules():
+            if "GET" in rule.methods and not rule.arguments:
+                c.get(rule.rule)  # status is irrelevant; 4xx still warms the path
+    # The sweep filled the list caches with empty results
+    cache.clear()
+
+@pytest.fixture(autouse=True)
+def clean_db(request, app):
+    """
+    Isolate each test's data. HTTP tests (using `client`) run inside a
+    rolled-back transaction; service-level tests that spawn threads need real
+    commits across connections, so they truncate what they wrote afterwards.
+    Either way the tables are empty again for the next test. Tests marked
+    `no_db` skip both.
+    """
+    if request.node.get_closest_marker("no_db"):
+        yield
+    elif "client" in request.fixturenames:
+        with _rolled_back(app):
+            yield
+    else:
+        try:
+            yield
+        finally:
+            _truncate(app)
+    # Cached list responses would otherwise outlive the test's rows
+    cache.clear()
 
 
 @pytest.fixture()
 def client(app):
     return app.test_client()
 
+@pytest.fixture()
+def diesel_fuel(app, client):
+    """Id of a "Diesel" fuel type priced 90.000 with 100.000 L in stock."""
+    return seed_fuel(app)
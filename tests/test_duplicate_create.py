@@ -23,6 +23,4 @@ class TestDuplicateCreate:
 
         # Sanity: DB should still only contain 1 Diesel fuel type
         r3 = client.get("/fuel-types")
-        all_fuels = r3.get_json()
-        diesel_fuels = [ft for ft in all_fuels if ft["name"] == "Diesel"]
-        assert len(diesel_fuels) == 1
+        assert sum(1 for ft in r3.get_json() if ft["name"] == "Diesel") == 1
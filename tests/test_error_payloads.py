@@ -10,27 +10,28 @@ class TestErrorPayloads:
         if expected_code:
             assert err["code"] == expected_code
 
-    def test_404_not_found_route(self, client):
-        r = client.get("/does-not-exist")
+    @pytest.mark.parametrize("method, url, payload, expected_status, expected_code", [
         # Our global HTTPException handler maps to code "NOT_FOUND"
-        self._assert_error_shape(r, 404, "NOT_FOUND")
-
-    def test_400_bad_request_validation(self, client):
+        ("get", "/does-not-exist", None, 404, "NOT_FOUND"),
         # litres <= 0 should trigger 400 BAD_REQUEST from validations
-        r = client.post("/sales", json={"fuel_type_id": 9999, "litres": "0.000"})
-        self._assert_error_shape(r, 400, "BAD_REQUEST")
+        ("post", "/sales", {"fuel_type_id": 9999, "litres": "0.000"}, 400, "BAD_REQUEST"),
+    ], ids=["404-route", "400-validation"])
+    def test_error_payload(self, client, method, url, payload, expected_status, expected_code):
+        r = client.open(url, method=method.upper(), json=payload)
+        self._assert_error_shape(r, expected_status, expected_code)
 
-    def test_409_conflict_insufficient_stock(self, client):
-        # Create fuel type with tiny stock, then oversell
-        r = client.post("/fuel-types", json={"name": "ErrDiesel", "price_per_litre": "90.000", "initial_stock_litres": "1.000"})
-        fid = r.get_json()["id"]
-        r = client.post("/sales", json={"fuel_type_id": fid, "litres": "5.000"})
-        # app may use 409 per our InsufficientStockError mapping
+    def test_409_conflict_insufficient_stock(self, client, diesel_fuel):
+        # Oversell the seeded 100 L; InsufficientStockError maps to 409
+        r = client.post("/sales", json={"fuel_type_id": diesel_fuel, "litres": "500.000"})
         self._assert_error_shape(r, 409, "INSUFFICIENT_STOCK")
 
-    def test_500_internal_error_with_mock(self, client, mocker):
+    def test_500_internal_error_with_mock(self, client, monkeypatch):
+        calls = []
+        def _boom(*args, **kwargs):
+            calls.append(args)
+            raise Exception("boom")
         # Patch the *imported* symbol in the view module
-        mocked = mocker.patch("src.apis.sales.record_sale", side_effect=Exception("boom"))
+        monkeypatch.setattr("src.apis.sales.record_sale", _boom)
         r = client.post("/sales", json={"fuel_type_id": 1, "litres": "1.000"})
         self._assert_error_shape(r, 500, "INTERNAL_ERROR")
-        assert mocked.called
+        assert calls
@@ -1,11 +1,13 @@
 from decimal import Decimal
 
+from tests._helpers import by_id, seed_fuel
+
+EMPTY = Decimal("0.000")
+
 class TestExactStockDepletion:
-    def test_sell_exact_remaining_then_fail_next(self, client):
+    def test_sell_exact_remaining_then_fail_next(self, app, client):
         # Seed 50L at price 90
-        r = client.post("/fuel-types", json={"name": "Exact", "price_per_litre": "90.000", "initial_stock_litres": "50.000"})
-        assert r.status_code == 201
-        fid = r.get_json()["id"]
+        fid = seed_fuel(app, "Exact", "90.000", "50.000")
 
         # Sell exactly 50L
         r = client.post("/sales", json={"fuel_type_id": fid, "litres": "50.000"})
@@ -13,9 +15,8 @@ class TestExactStockDepletion:
 
         # Inventory should be 0
         r = client.get("/inventory")
-        inv = r.get_json()
-        rec = next(x for x in inv if x["fuel_type_id"] == fid)
-        assert Decimal(rec["stock_litres"]) == Decimal("0.000")
+        rec = by_id(r.get_json())[fid]
+        assert Decimal(rec["stock_litres"]) == EMPTY
 
         # Any further sale should fail with insufficient stock
         r = client.post("/sales", json={"fuel_type_id": fid, "litres": "1.000"})
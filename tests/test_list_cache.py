@@ -0,0 +1,16 @@
+from decimal import Decimal
+
+class TestListCache:
+    def test_writes_invalidate_cached_lists(self, client, diesel_fuel):
+        fid = diesel_fuel
+
+        # Prime both caches
+        assert client.get("/fuel-types").get_json()[0]["price_per_litre"] == "90.000"
+        assert Decimal(client.get("/inventory").get_json()[0]["stock_litres"]) == Decimal("100.000")
+
+        client.patch(f"/fuel-types/{fid}/price", json={"price_per_litre": "92.500"})
+        client.post("/sales", json={"fuel_type_id": fid, "litres": "10.000"})
+
+        # Both lists reflect the writes immediately, well inside their TTLs
+        assert client.get("/fuel-types").get_json()[0]["price_per_litre"] == "92.500"
+        assert Decimal(client.get("/inventory").get_json()[0]["stock_litres"]) == Decimal("90.000")
@@ -1,12 +1,26 @@
+import pytest
+
 class TestMetaEndpoints:
-    def test_health_ok(self, client):
-        r = client.get("/health")
+    # The static meta views are called directly: no test client, no DB transaction
+    @pytest.mark.no_db
+    def test_health_ok(self, app):
+        with app.test_request_context("/health"):
+            r = app.view_functions["utility.health"]()
         assert r.status_code == 200
         body = r.get_json()
         assert body == {"status": "healthy"}
 
-    def test_index_lists_endpoints(self, client):
-        r = client.get("/")
+    def test_trailing_slash_served_without_redirect(self, client):
+        r = client.get("/health/")
+        assert r.status_code == 200
+        r = client.get("/fuel-types/")
+        assert r.status_code == 200
+        assert isinstance(r.get_json(), list)
+
+    @pytest.mark.no_db
+    def test_index_lists_endpoints(self, app):
+        with app.test_request_context("/"):
+            r = app.view_functions["utility.index"]()
         assert r.status_code == 200
         body = r.get_json()
         assert body.get("status") == "ok"
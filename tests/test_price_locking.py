@@ -1,15 +1,17 @@
 from decimal import Decimal
 
+PRICE_90 = Decimal("90.000")
+PRICE_92_5 = Decimal("92.500")
+
 class TestPriceLocking:
-    def test_sale_uses_current_price_at_time_of_sale(self, client):
-        # create @ 90
-        r = client.post("/fuel-types", json={"name":"Diesel","price_per_litre":"90.000","initial_stock_litres":"100.000"})
-        fid = r.get_json()["id"]
+    def test_sale_uses_current_price_at_time_of_sale(self, client, diesel_fuel):
+        # created @ 90
+        fid = diesel_fuel
 
         # sale #1 at 90
         r = client.post("/sales", json={"fuel_type_id": fid, "litres": "10.000"})
         assert r.status_code == 201
-        assert Decimal(r.get_json()["price_at_sale"]) == Decimal("90.000")
+        assert Decimal(r.get_json()["price_at_sale"]) == PRICE_90
 
         # update to 92.5
         r = client.patch(f"/fuel-types/{fid}/price", json={"price_per_litre":"92.500"})
@@ -17,4 +19,4 @@ class TestPriceLocking:
 
         # sale #2 at 92.5
         r = client.post("/sales", json={"fuel_type_id": fid, "litres": "10.000"})
-        assert Decimal(r.get_json()["price_at_sale"]) == Decimal("92.500")
+        assert Decimal(r.get_json()["price_at_sale"]) == PRICE_92_5
@@ -1,31 +1,31 @@
+import pytest
+
+from src import cache
+from tests._helpers import seed_fuel
+
+@pytest.fixture()
+def seeded_sales(app, client):
+    """Two sales either side of a 90.000 -> 92.500 price change; returns the fuel type id."""
+    return seed_fuel(app, steps=[("sale", "10.000"), ("price", "92.500"), ("sale", "5.000")])
+
 class TestReportingAPI:
-    def test_reporting_endpoints(self, client):
-        # seed a little data
-        r = client.post("/fuel-types", json={"name":"Diesel","price_per_litre":"90.000","initial_stock_litres":"200.000"})
-        fid = r.get_json()["id"]
-        client.post("/sales", json={"fuel_type_id": fid, "litres":"10.000"})
-        client.patch(f"/fuel-types/{fid}/price", json={"price_per_litre":"92.500"})
-        client.post("/sales", json={"fuel_type_id": fid, "litres":"5.000"})
-
-        # overview
-        r = client.get("/reports/sales/overview")
-        assert r.status_code == 200
-        assert "total_revenue" in r.get_json()
-
-        # timeseries
-        r = client.get("/reports/sales/timeseries?granularity=day")
-        assert r.status_code == 200
-        assert isinstance(r.get_json(), list)
-
-        # by fuel type
-        r = client.get("/reports/sales/by-fuel-type")
-        assert r.status_code == 200
-        assert isinstance(r.get_json(), list)
-
-        # price history
-        r = client.get(f"/reports/price/history?fuel_type_id={fid}")
-        assert r.status_code == 200
-        assert isinstance(r.get_json(), list)
+    def test_reporting_endpoints(self, client, seeded_sales):
+        fid = seeded_sales
+
+        # One client context for the whole read-only sweep
+        with client as c:
+            for url, expected_type in (
+                ("/reports/sales/overview", dict),
+                ("/reports/sales/timeseries?granularity=day", list),
+                ("/reports/sales/by-fuel-type", list),
+                (f"/reports/price/history?fuel_type_id={fid}", list),
+            ):
+                r = c.get(url)
+                assert r.status_code == 200, url
+                body = r.get_json()
+                assert isinstance(body, expected_type), url
+                if expected_type is dict:
+                    assert "total_revenue" in body
    
     def test_reporting_invalid_date_param(self, client):
         # Bad "from" param -> marshmallow ValidationError
@@ -40,3 +40,30 @@ class TestReportingAPI:
         body = r.get_json()
         assert body["error"]["code"] in ("BAD_REQUEST", "VALIDATION_ERROR")
         assert "fuel_type_id" in body["error"]["message"]
+
+    def test_daily_rollup_matches_raw_scan(self, client, seeded_sales):
+        # A multi-row insert, so the statement-level trigger folds several rows at once
+        client.post("/sales/bulk", json={"items": [{"fuel_type_id": seeded_sales, "litres":"5.000"},
+                                                   {"fuel_type_id": seeded_sales, "litres":"2.500"}]})
+
+        # Whole-day range (no "to") is served from sales_daily; adding "to" forces the raw scan
+        for path in ("/reports/sales/overview", "/reports/sales/timeseries", "/reports/sales/by-fuel-type"):
+            rollup = client.get(f"{path}?from=2000-01-01").get_json()
+            raw = client.get(f"{path}?from=2000-01-01&to=2999-12-31").get_json()
+            assert rollup == raw
+
+    def test_bounded_report_sees_new_sale(self, app, client, diesel_fuel):
+        fid = diesel_fuel
+        client.post("/sales", json={"fuel_type_id": fid, "litres":"10.000"})
+
+        # Only windows that already ended are memoized; one reaching into the
+        # future must see a sale even when it bypasses the sales views
+        path = "/reports/sales/overview?from=2000-01-01&to=2999-12-31"
+        assert client.get(path).get_json()["tx_count"] == 1
+        seed_fuel(app, "Petrol", "100.000", "50.000", steps=[("sale", "5.000")])
+        assert client.get(path).get_json()["tx_count"] == 2
+
+    def test_closed_window_is_memoized(self, app, client, diesel_fuel):
+        path = "/reports/sales/overview?from=2000-01-01&to=2000-12-31"
+        assert client.get(path).get_json()["tx_count"] == 0
+        assert any(key[0] == "sales_overview" for key in cache._CACHE)
@@ -0,0 +1,49 @@
+from decimal import Decimal
+
+import pytest
+
+from src.models.schemas import MAX_BULK_ITEMS
+
+class TestSalesBulk:
+    def test_bulk_sales_recorded_in_order(self, client, diesel_fuel):
+        d = diesel_fuel
+        r = client.post("/fuel-types", json={"name": "Petrol", "price_per_litre": "100.000", "initial_stock_litres": "50.000"})
+        p = r.get_json()["id"]
+
+        items = [
+            {"fuel_type_id": d, "litres": "10.000"},
+            {"fuel_type_id": p, "litres": "5.000"},
+            {"fuel_type_id": d, "litres": "20.000"},
+        ]
+        r = client.post("/sales/bulk", json={"items": items})
+        assert r.status_code == 201
+        sales = r.get_json()
+        assert [s["fuel_type_id"] for s in sales] == [d, p, d]
+        assert Decimal(sales[1]["amount"]) == Decimal("500.00")
+
+        stock = {x["fuel_type_id"]: Decimal(x["stock_litres"]) for x in client.get("/inventory").get_json()}
+        assert stock == {d: Decimal("70.000"), p: Decimal("45.000")}
+
+    def test_bulk_is_all_or_nothing(self, client):
+        r = client.post("/fuel-types", json={"name": "Diesel", "price_per_litre": "90.000", "initial_stock_litres": "25.000"})
+        d = r.get_json()["id"]
+
+        # Each line fits on its own, but together they exceed stock
+        items = [{"fuel_type_id": d, "litres": "20.000"}, {"fuel_type_id": d, "litres": "10.000"}]
+        r = client.post("/sales/bulk", json={"items": items})
+        assert r.status_code == 409
+        assert r.get_json()["error"]["code"] == "INSUFFICIENT_STOCK"
+
+        r = client.post("/sales/bulk", json={"items": [{"fuel_type_id": d, "litres": "1.000"},
+                                                       {"fuel_type_id": 999999, "litres": "1.000"}]})
+        assert r.status_code == 404
+
+        assert client.get("/sales").get_json() == []
+        assert Decimal(client.get("/inventory").get_json()[0]["stock_litres"]) == Decimal("25.000")
+
+    @pytest.mark.parametrize("count", [0, MAX_BULK_ITEMS + 1], ids=["empty", "over_cap"])
+    def test_bulk_item_count_is_bounded(self, client, count):
+        items = [{"fuel_type_id": 1, "litres": "1.000"}] * count
+        r = client.post("/sales/bulk", json={"items": items})
+        assert r.status_code == 400
+        assert r.get_json()["error"]["code"] == "BAD_REQUEST"
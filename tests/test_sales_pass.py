@@ -1,5 +1,13 @@
 from decimal import Decimal
 
+from src.modules import sales_service
+from tests._helpers import seed_fuel
+
+PRICE_90 = Decimal("90.000")
+STOCK_AFTER_REFILL = Decimal("600.000")
+STOCK_AFTER_SALE = Decimal("550.000")
+AMOUNT_50L_AT_90 = Decimal("4500.00")
+
 class TestSalesPass:
     def test_create_refill_sell_flow(self, client):
         # Create fuel type
@@ -12,27 +20,23 @@ class TestSalesPass:
         # Refill
         r = client.post("/inventory/refill", json={"fuel_type_id": fuel_id, "litres": "100.000"})
         assert r.status_code == 200
-        assert Decimal(r.get_json()["new_stock_litres"]) == Decimal("600.000")
+        assert Decimal(r.get_json()["new_stock_litres"]) == STOCK_AFTER_REFILL
 
         # Sell 50L
         r = client.post("/sales", json={"fuel_type_id": fuel_id, "litres": "50.000"})
         assert r.status_code == 201
         sale = r.get_json()
-        assert Decimal(sale["price_at_sale"]) == Decimal("90.000")
-        assert Decimal(sale["amount"]) == Decimal("4500.00")
+        assert Decimal(sale["price_at_sale"]) == PRICE_90
+        assert Decimal(sale["amount"]) == AMOUNT_50L_AT_90
 
         # Inventory decreased
         r = client.get("/inventory")
         inv = r.get_json()
-        assert Decimal(inv[0]["stock_litres"]) == Decimal("550.000")
+        assert Decimal(inv[0]["stock_litres"]) == STOCK_AFTER_SALE
 
-    def test_list_sales_with_filters(self, client):
+    def test_list_sales_with_filters(self, app, client):
         # Create & sell
-        r = client.post("/fuel-types", json={
-            "name": "Petrol", "price_per_litre": "100.000", "initial_stock_litres": "200.000"
-        })
-        fid = r.get_json()["id"]
-        client.post("/sales", json={"fuel_type_id": fid, "litres": "10.000"})
+        fid = seed_fuel(app, "Petrol", "100.000", "200.000", steps=[("sale", "10.000")])
 
         # List without filters
         r = client.get("/sales")
@@ -43,5 +47,21 @@ class TestSalesPass:
         r = client.get(f"/sales?fuel_type_id={fid}")
         assert r.status_code == 200
         assert all(s["fuel_type_id"] == fid for s in r.get_json())
-        
 
+    def test_list_sales_streams_across_batches(self, app, client, monkeypatch):
+        # Shrink the cursor batch so the streamed array spans several chunks
+        monkeypatch.setattr(sales_service, "_LIST_BATCH", 2)
+        seed_fuel(app, "Petrol", "100.000", "200.000", steps=[("sale", "1.000")] * 5)
+
+        r = client.get("/sales")
+        assert r.status_code == 200
+        assert len(r.get_json()) == 5
+
+    def test_list_sales_failure_before_streaming_is_500(self, client, monkeypatch):
+        def _boom(*args, **kwargs):
+            raise RuntimeError("boom")
+            yield  # pragma: no cover - makes this a generator like iter_sales
+        monkeypatch.setattr("src.apis.sales.iter_sales", _boom)
+        r = client.get("/sales")
+        assert r.status_code == 500
+        assert r.get_json()["error"]["code"] == "INTERNAL_ERROR"
@@ -1,29 +1,24 @@
-class TestValidations:
-    def test_create_fuel_type_negative_price(self, client):
-        r = client.post("/fuel-types", json={
-            "name": "Petrol", "price_per_litre": "-1.000", "initial_stock_litres": "0.000"
-        })
-        assert r.status_code == 400
+import pytest
 
-    def test_refill_nonpositive_litres(self, client):
-        r = client.post("/inventory/refill", json={"fuel_type_id": 123, "litres": "0.000"})
+class TestValidations:
+    # Cases that need no existing row share one table-driven test
+    @pytest.mark.parametrize("method, url, payload", [
+        pytest.param("post", "/fuel-types",
+                     {"name": "Petrol", "price_per_litre": "-1.000", "initial_stock_litres": "0.000"},
+                     id="neg_price"),
+        pytest.param("post", "/inventory/refill", {"fuel_type_id": 123, "litres": "0.000"},
+                     id="refill_nonpositive_litres"),
+    ])
+    def test_validation_errors(self, client, method, url, payload):
+        r = client.open(url, method=method.upper(), json=payload)
         assert r.status_code == 400
 
-    def test_update_price_negative(self, client):
-        # first create
-        r = client.post("/fuel-types", json={"name": "Diesel", "price_per_litre": "90.000"})
-        fid = r.get_json()["id"]
-        # then try bad price
-        r = client.patch(f"/fuel-types/{fid}/price", json={"price_per_litre": "-2.000"})
+    def test_update_price_negative(self, client, diesel_fuel):
+        r = client.patch(f"/fuel-types/{diesel_fuel}/price", json={"price_per_litre": "-2.000"})
         assert r.status_code == 400
-    def test_sale_nonpositive_litres(self, client):
-        # First create a valid fuel type
-        r = client.post("/fuel-types", json={
-            "name": "Diesel", "price_per_litre": "90.000", "initial_stock_litres": "100.000"
-        })
-        fid = r.get_json()["id"]
 
-        # Try to sell 0 litres -> should trigger ValidationError in record_sale
-        r = client.post("/sales", json={"fuel_type_id": fid, "litres": "0.000"})
+    def test_sale_nonpositive_litres(self, client, diesel_fuel):
+        # Selling 0 litres -> ValidationError in record_sale
+        r = client.post("/sales", json={"fuel_type_id": diesel_fuel, "litres": "0.000"})
         assert r.status_code == 400
         assert r.get_json()["error"]["code"] == "BAD_REQUEST"